@@ -1,13 +1,196 @@
 #!/usr/bin/python3
 
 import argparse
-import json
+import array
+import collections
+import concurrent.futures
+import ctypes
+import errno
+import fcntl
 import logging
 import os
+import pickle
 import shutil
+import stat
 import subprocess
 import time
-import datetime
+
+import numpy as np
+
+try:
+    import liburing  # optional; batched statx via io_uring when present
+except ImportError:
+    liburing = None
+
+try:
+    import numba  # optional; compiled classification kernel when present
+except ImportError:
+    numba = None
+
+# statx(2) through glibc with AT_STATX_DONT_SYNC: the kernel answers from
+# cached attributes instead of revalidating with the server, which saves a
+# round-trip per file on networked/FUSE (mergerfs) backends.
+_AT_FDCWD = -100
+_AT_SYMLINK_NOFOLLOW = 0x100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_SIZE = 0x200
+_STATX_ATIME = 0x20
+_STATX_MTIME = 0x40
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_int64),
+        ("tv_nsec", ctypes.c_uint32),
+        ("__reserved", ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("__spare0", ctypes.c_uint16 * 1),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("stx_attributes_mask", ctypes.c_uint64),
+        ("stx_atime", _StatxTimestamp),
+        ("stx_btime", _StatxTimestamp),
+        ("stx_ctime", _StatxTimestamp),
+        ("stx_mtime", _StatxTimestamp),
+        ("stx_rdev_major", ctypes.c_uint32),
+        ("stx_rdev_minor", ctypes.c_uint32),
+        ("stx_dev_major", ctypes.c_uint32),
+        ("stx_dev_minor", ctypes.c_uint32),
+        ("__spare2", ctypes.c_uint64 * 14),
+    ]
+
+
+try:
+    _libc = ctypes.CDLL(None, use_errno=True)
+    _libc.statx.argtypes = [
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_int,
+        ctypes.c_uint,
+        ctypes.POINTER(_Statx),
+    ]
+except (OSError, AttributeError):
+    _libc = None  # not glibc >= 2.28, fall back to os.stat
+
+_StatResult = collections.namedtuple(
+    "_StatResult", ["st_size", "st_atime", "st_mtime", "st_dev"]
+)
+
+
+def fast_stat(path):
+    """Stat one path without triggering server-side revalidation.
+
+    Issues statx(AT_STATX_DONT_SYNC | AT_SYMLINK_NOFOLLOW) asking only for
+    the fields the metadata tables use; falls back to os.stat where statx
+    is unavailable (non-Linux / old glibc).
+    """
+    if _libc is None:
+        return os.stat(path, follow_symlinks=False)
+
+    buf = _Statx()
+    ret = _libc.statx(
+        _AT_FDCWD,
+        os.fsencode(path),
+        _AT_SYMLINK_NOFOLLOW | _AT_STATX_DONT_SYNC,
+        _STATX_SIZE | _STATX_ATIME | _STATX_MTIME,
+        ctypes.byref(buf),
+    )
+
+    if ret != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err), path)
+
+    return _StatResult(
+        buf.stx_size,
+        buf.stx_atime.tv_sec,
+        buf.stx_mtime.tv_sec,
+        os.makedev(buf.stx_dev_major, buf.stx_dev_minor),
+    )
+
+
+class SnapTable:
+    """Struct-of-arrays file metadata for one tree (a snapshot or the livefs).
+
+    Files are kept as parallel arrays (paths + packed int64 stat columns)
+    instead of a dict of stat tuples; row i of each array describes one file.
+    This keeps the pickle small and makes the size/atime hot loops cheap.
+
+    Paths are stored relative to 'root', so the same file carries the same
+    key in the livefs table and in a snapshot table and membership tests
+    need no string rewriting.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.paths = []
+        self.st_size = array.array("q")
+        self.st_atime = array.array("q")
+        self.st_mtime = array.array("q")
+        self.st_dev = array.array("q")
+        # rel dirpath -> (dir mtime, [row tuples]); lets the next run reuse
+        # a directory's file stats when its mtime is unchanged
+        self.dir_index = {}
+        self._path_set = None
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_path_set"] = None  # rebuilt lazily, no point pickling it
+        return state
+
+    def append_row(self, row):
+        path, size, atime, mtime, dev = row
+        self.paths.append(path)
+        self.st_size.append(size)
+        self.st_atime.append(atime)
+        self.st_mtime.append(mtime)
+        self.st_dev.append(dev)
+        self._path_set = None
+
+    def path_set(self):
+        # frozenset: built once per run, hashes every relpath exactly once;
+        # each live-file lookup then costs a single precomputed-hash probe
+        if self._path_set is None:
+            self._path_set = frozenset(self.paths)
+        return self._path_set
+
+    def finalize(self):
+        """Convert the packed columns to int64 numpy arrays for the hot loops."""
+        self.__dict__.pop("dirs", None)  # dropped column; discard from old pickles
+        self.__dict__.setdefault("dir_index", {})  # absent in older pickles
+        self.st_size = np.asarray(self.st_size, dtype=np.int64)
+        self.st_atime = np.asarray(self.st_atime, dtype=np.int64)
+        self.st_mtime = np.asarray(self.st_mtime, dtype=np.int64)
+        self.st_dev = np.asarray(self.st_dev, dtype=np.int64)
+
+    def remove(self, indices):
+        """Drop the given row indices from every column in one mask pass."""
+        if len(indices) == 0:
+            return
+
+        keep = np.ones(len(self.paths), dtype=bool)
+        keep[np.asarray(indices, dtype=np.intp)] = False
+
+        self.paths = [p for p, k in zip(self.paths, keep) if k]
+        self.st_size = self.st_size[keep]
+        self.st_atime = self.st_atime[keep]
+        self.st_mtime = self.st_mtime[keep]
+        self.st_dev = self.st_dev[keep]
+        self._path_set = None
 
 
 def load_metadata(path):
@@ -16,9 +199,20 @@ def load_metadata(path):
         logging.debug(f"Loading existing metadata at '{path}'...")
 
         try:
-            f = open(path)
-            metadata = json.load(f)
-            f.close()
+            metadata = {}
+            with open(path, "rb") as f:
+                while True:
+                    try:
+                        n, table = pickle.load(f)
+                    except EOFError:
+                        break
+
+                    if isinstance(table, SnapTable):
+                        table.finalize()
+                    elif not n.startswith("_"):  # reserved keys hold plain values
+                        raise TypeError("unexpected metadata format")
+
+                    metadata[n] = table
 
             return metadata
 
@@ -32,13 +226,210 @@ def load_metadata(path):
 
 def save_metadata(path, metadata: dict):
     logging.debug(f"Saving metadata at '{path}'...")
-    with open(path, "w") as f:
-        json.dump(metadata, f)
+    with open(path, "wb") as f:
+        # One record per tree: the pickler only ever holds one table's
+        # memo, capping peak memory, and the file stays append-friendly.
+        for n, table in metadata.items():
+            pickle.dump((n, table), f, protocol=5)
 
     return metadata
 
 
-def update_metadata(cache_pool: str, metadata: dict):
+# Ring depth / SQEs per submit; batching statx amortizes syscall entry cost
+_URING_BATCH = 128
+_uring_broken = False  # set once on the first io_uring failure
+
+
+def _statx_batch_uring(paths):
+    """Batch-stat paths with IORING_OP_STATX; one result (or None) per path.
+
+    Up to _URING_BATCH statx requests go to the kernel per io_uring
+    round-trip, so the per-syscall entry/LSM cost is paid once per batch
+    instead of once per file. Paths that fail (e.g. vanished since the
+    enumeration) come back as None.
+    """
+    results = [None] * len(paths)
+    flags = _AT_SYMLINK_NOFOLLOW | _AT_STATX_DONT_SYNC
+    mask = _STATX_SIZE | _STATX_ATIME | _STATX_MTIME
+
+    ring = liburing.io_uring()
+    cqe = liburing.io_uring_cqe()
+    liburing.io_uring_queue_init(_URING_BATCH, ring, 0)
+
+    try:
+        for start in range(0, len(paths), _URING_BATCH):
+            chunk = paths[start : start + _URING_BATCH]
+            bufs = liburing.statx(len(chunk))
+            # keep the encoded paths alive until the CQEs are reaped
+            encoded = [os.fsencode(p) for p in chunk]
+
+            for j in range(len(chunk)):
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_statx(
+                    sqe, _AT_FDCWD, encoded[j], flags, mask, bufs[j]
+                )
+                sqe.user_data = j
+
+            liburing.io_uring_submit(ring)
+
+            for _ in range(len(chunk)):
+                liburing.io_uring_wait_cqe(ring, cqe)
+                j = cqe.user_data
+                if cqe.res == 0:
+                    buf = bufs[j]
+                    results[start + j] = _StatResult(
+                        buf.stx_size,
+                        buf.stx_atime.tv_sec,
+                        buf.stx_mtime.tv_sec,
+                        os.makedev(buf.stx_dev_major, buf.stx_dev_minor),
+                    )
+                liburing.io_uring_cqe_seen(ring, cqe)
+    finally:
+        liburing.io_uring_queue_exit(ring)
+
+    return results
+
+
+def _walk_scandir(root, dev=None):
+    """Recursively walk 'root' with os.scandir, yielding (dirpath, dirstat, file_entries).
+
+    DirEntry.stat() reuses the inode data returned by getdents on Linux, so the
+    whole walk costs one statx per entry instead of the extra stat/exists calls
+    an os.walk + os.stat traversal issues. When 'dev' is given, directories on a
+    different device are not entered (same pruning as the livefs walk).
+    """
+    try:
+        rootstat = os.stat(root)
+    except OSError as e:
+        logging.warning(f"Failed to stat '{root}': {e}")
+        return
+
+    if dev is not None and rootstat.st_dev != dev:
+        return
+
+    stack = [(root, rootstat)]
+
+    while stack:
+        current_dir, dirstat = stack.pop()
+
+        file_entries = []
+        try:
+            with os.scandir(current_dir) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        st = entry.stat(follow_symlinks=False)
+                        if dev is None or st.st_dev == dev:
+                            stack.append((entry.path, st))
+                    else:
+                        file_entries.append(entry)
+        except OSError as e:
+            logging.warning(f"Failed to scan '{current_dir}': {e}")
+            continue
+
+        yield current_dir, dirstat, file_entries
+
+
+def _scan_tree(root, dev=None, prev=None, track_dirs=False):
+    """Walk one tree and collect its stats into a SnapTable.
+
+    When 'prev' is the previous run's table for the same root, directories
+    whose mtime is unchanged reuse the recorded file rows instead of
+    re-stat'ing every entry — adds, removes and renames all bump the dir
+    mtime, so only changed directories pay for fresh stats. (atime-only
+    reads don't bump it; those rows refresh once the dir next changes.)
+
+    'track_dirs' records the per-dir rows needed to serve as 'prev' on the
+    next run. Only the livefs gets rescanned, so snapshot tables skip the
+    bookkeeping — it would just duplicate every row in memory and in the
+    pickle.
+    """
+    global _uring_broken
+
+    table = SnapTable(root)
+    prefix = len(root.rstrip("/")) + 1  # strip "<root>/" off entry paths
+    use_uring = liburing is not None and not _uring_broken
+    prev_index = prev.dir_index if prev is not None else {}
+
+    pending = []  # (rel_dir, full path) awaiting a batched stat
+
+    for current_dir, dirstat, file_entries in _walk_scandir(root, dev):
+        rel_dir = current_dir[prefix:]
+        # nanosecond mtime: second granularity would miss a change landing
+        # in the same second as the previous scan
+        dir_mtime = dirstat.st_mtime_ns
+
+        cached = prev_index.get(rel_dir)
+        if cached is not None and cached[0] == dir_mtime:
+            for row in cached[1]:
+                table.append_row(row)
+            table.dir_index[rel_dir] = cached
+            continue
+
+        rows = None
+        if track_dirs:
+            rows = []
+            table.dir_index[rel_dir] = (dir_mtime, rows)
+
+        for entry in file_entries:
+            if use_uring:
+                pending.append((rel_dir, entry.path))
+                continue
+
+            try:
+                st = fast_stat(entry.path)
+            except OSError:
+                continue  # vanished between scandir and stat
+
+            row = (
+                entry.path[prefix:],
+                st.st_size,
+                int(st.st_atime),
+                int(st.st_mtime),
+                st.st_dev,
+            )
+            table.append_row(row)
+            if rows is not None:
+                rows.append(row)
+
+    if pending:
+        stats = None
+        try:
+            stats = _statx_batch_uring([path for _, path in pending])
+        except Exception as e:
+            logging.warning(f"io_uring statx failed ({e}), using plain statx...")
+            _uring_broken = True
+
+        if stats is None:
+            stats = []
+            for _, path in pending:
+                try:
+                    stats.append(fast_stat(path))
+                except OSError:
+                    stats.append(None)  # vanished between scandir and stat
+
+        for (rel_dir, path), st in zip(pending, stats):
+            if st is None:
+                continue
+
+            row = (
+                path[prefix:],
+                st.st_size,
+                int(st.st_atime),
+                int(st.st_mtime),
+                st.st_dev,
+            )
+            table.append_row(row)
+            if track_dirs:
+                table.dir_index[rel_dir][1].append(row)
+
+    table.finalize()
+    return table
+
+
+def update_metadata(cache_pool: str, metadata: dict, base_dev=None):
+    # Collect the trees that need scanning; each becomes one worker job
+    jobs = {}  # n -> (root, dev, prev table)
+
     # Snapshots
     snap_main = os.path.join(cache_pool, ".snapshots")
 
@@ -59,21 +450,11 @@ def update_metadata(cache_pool: str, metadata: dict):
             logging.debug(f"Updating metadata for snapshot ({n})")
 
             snap_dir = os.path.join(snap_main, n, "snapshot")  # .snapshots/23/snapshot
-            metadata.setdefault(n, {"files": {}, "dirs": {}, "root": snap_dir})
-
-            for current_dir, dirs, filenames in os.walk(snap_dir):
-
-                metadata[n]["dirs"][current_dir] = os.stat(current_dir)
-
-                for fn in filenames:
-                    fp = os.path.join(current_dir, fn)
-
-                    if os.path.exists(fp):
-                        metadata[n]["files"][fp] = os.stat(fp)
+            jobs[n] = (snap_dir, None, None)
 
         # Remove old snapshot data
         for k in list(metadata.keys()):
-            if k == "0":
+            if k == "0" or k.startswith("_"):
                 continue
 
             if k not in current_snapshots:
@@ -83,89 +464,343 @@ def update_metadata(cache_pool: str, metadata: dict):
     # Livefs
     logging.debug("Updating metadata for live filesystem...")
 
-    base_dev = os.stat(cache_pool).st_dev
-    metadata["0"] = {"files": {}, "dirs": {}, "root": cache_pool}
+    if base_dev is None:
+        base_dev = os.stat(cache_pool).st_dev
+    # hand the previous livefs table to the scanner so unchanged
+    # directories skip their per-file stats
+    jobs["0"] = (cache_pool, base_dev, metadata.get("0"))
+
+    # The walks release the GIL across getdents/statx, so threads overlap
+    # kernel I/O; results are assigned on this thread as workers complete.
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(8, len(jobs))
+    ) as executor:
+        futures = {
+            executor.submit(_scan_tree, root, dev, prev, n == "0"): n
+            for n, (root, dev, prev) in jobs.items()
+        }
+
+        for future in concurrent.futures.as_completed(futures):
+            n = futures[future]
+            metadata[n] = future.result()
+
+    # Snapshot numbers are numeric strings; a lexicographic max would pick
+    # "9" over "23", so compare as integers and cache the winner.
+    snap_nums = [int(k) for k in metadata if k.isdigit() and k != "0"]
+    if snap_nums:
+        metadata["_latest"] = str(max(snap_nums))
+    else:
+        metadata.pop("_latest", None)
 
-    for current_dir, dirs, filenames in os.walk(cache_pool):
+    return metadata
 
-        metadata["0"]["dirs"][current_dir] = os.stat(current_dir)
 
-        if os.stat(current_dir).st_dev != base_dev:
-            dirs[:] = []
-            continue
+# No cache=True: numba keys its on-disk cache by defining module name, and
+# this dash-named script gets imported under arbitrary names (importlib), so
+# a cached kernel can fail to load with ModuleNotFoundError on the next run.
+_numba_broken = False  # set once on the first kernel failure
 
-        for fn in filenames:
-            fp = os.path.join(current_dir, fn)
-            if os.path.exists(fp):
-                metadata["0"]["files"][fp] = os.stat(fp)
+if numba is not None:
 
-    return metadata
+    @numba.njit(parallel=True)
+    def _in_sorted_kernel(live_hashes, snap_hashes):
+        """out[i] is True when live_hashes[i] occurs in sorted snap_hashes."""
+        n = live_hashes.size
+        out = np.empty(n, dtype=np.bool_)
 
+        for i in numba.prange(n):
+            h = live_hashes[i]
+            lo = 0
+            hi = snap_hashes.size
 
-def get_filelists(metadata, stale_days=-1):
-    latest_snap_num = max(metadata)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if snap_hashes[mid] < h:
+                    lo = mid + 1
+                else:
+                    hi = mid
 
-    in_snap = []
-    not_in_snap = []
-    stale_files = []
+            out[i] = lo < snap_hashes.size and snap_hashes[lo] == h
 
-    for fp in metadata["0"]["files"]:
-        o = (fp, metadata["0"]["files"][fp])
+        return out
 
-        fp_snap = fp.replace(metadata["0"]["root"], metadata[latest_snap_num]["root"])
 
-        if stale_days > 0:
-            atime_dt = datetime.datetime.fromtimestamp(metadata["0"]["files"][fp][7])
-            stale_dt = datetime.datetime.now() - datetime.timedelta(days=stale_days)
-            if atime_dt < stale_dt:
-                stale_files.append(o)
+def _mount_is_noatime(path):
+    """True when the mount covering 'path' carries the noatime option.
 
-        if fp_snap in metadata[latest_snap_num]["files"]:
-            in_snap.append(o)
-        else:
-            not_in_snap.append(o)
+    On a noatime mount the atime column is frozen at whatever the files were
+    created with, so sorting by it produces an essentially random eviction
+    order; the caller falls back to mtime instead. relatime still updates
+    atime (at most daily), which is plenty for this policy, so it keeps the
+    normal atime sort.
+    """
+    try:
+        path = os.path.realpath(path)
+        best_opts = None
+        best_len = -1
+
+        with open("/proc/self/mountinfo") as f:
+            for line in f:
+                fields = line.split()
+                mount_point = fields[4].replace("\\040", " ")
+
+                if (
+                    path == mount_point
+                    or path.startswith(mount_point.rstrip("/") + "/")
+                ) and len(mount_point) > best_len:
+                    best_len = len(mount_point)
+                    best_opts = fields[5]
+
+        return best_opts is not None and "noatime" in best_opts.split(",")
+
+    except OSError:
+        return False  # no mountinfo (non-Linux); assume atime works
+
+
+def get_filelists(metadata, stale_days=-1, use_mtime=False):
+    """Classify live files, returning row indices into metadata["0"]."""
+    live = metadata["0"]
+    times = live.st_mtime if use_mtime else live.st_atime
+
+    latest_snap_num = metadata.get("_latest")
+    if latest_snap_num not in metadata:
+        snap_nums = [int(k) for k in metadata if k.isdigit() and k != "0"]
+        latest_snap_num = str(max(snap_nums)) if snap_nums else None
 
-    # sort by atime
-    atime_key = lambda t: t[1][7]
-    not_in_snap = sorted(not_in_snap, key=atime_key)
-    in_snap = sorted(in_snap, key=atime_key)
+    if latest_snap_num is not None:
+        snap_paths = metadata[latest_snap_num].path_set()
+    else:
+        snap_paths = frozenset()  # no snapshots yet: nothing is protected
+
+    global _numba_broken
+
+    n = len(live)
+    in_mask = None
+
+    if numba is not None and not _numba_broken and snap_paths and n:
+        # hash each path once in Python; the membership probes and branching
+        # run in the compiled parallel kernel. A 64-bit collision can only
+        # promote a file into the moved-later in-snapshot bucket, never lose
+        # it, so the approximation is safe for an eviction ordering.
+        try:
+            snap_hashes = np.sort(
+                np.fromiter(
+                    (hash(p) for p in snap_paths), dtype=np.int64, count=len(snap_paths)
+                )
+            )
+            live_hashes = np.fromiter(
+                (hash(p) for p in live.paths), dtype=np.int64, count=n
+            )
+            in_mask = _in_sorted_kernel(live_hashes, snap_hashes)
+        except Exception as e:
+            logging.warning(f"numba classify kernel failed ({e}), using set lookups...")
+            _numba_broken = True
+
+    if in_mask is None:
+        in_mask = np.zeros(n, dtype=bool)
+        for i, rel in enumerate(live.paths):
+            if rel in snap_paths:
+                in_mask[i] = True
+
+    stale_files = []
+    if stale_days > 0:
+        # one cutoff computed up front; the comparison is a single numpy op
+        stale_cutoff = time.time() - stale_days * 86400.0
+        stale_files = np.nonzero(times < stale_cutoff)[0]
+
+    # sort by access time; argsort over the int64 column replaces the per-row lambda
+    order = np.argsort(times, kind="stable")
+    order_in_snap = in_mask[order]
+    not_in_snap = order[~order_in_snap]
+    in_snap = order[order_in_snap]
 
     return not_in_snap, in_snap, stale_files
 
 
-def rsync_move(cache, backing, live_fp, audit_mode=False) -> bool:
-    cache = cache.rstrip("/")
-    backing = backing.rstrip("/")
+_FICLONE = 0x40049409  # linux/fs.h FICLONE ioctl
+
+
+def _copy_fd(src_fd, dst_fd):
+    """Copy src_fd to dst_fd inside the kernel; both offsets start at 0."""
+    try:
+        while os.copy_file_range(src_fd, dst_fd, 1 << 30) > 0:
+            pass
+        return
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EOPNOTSUPP, errno.ENOSYS, errno.EINVAL):
+            raise
+        # cross-device copy_file_range is kernel-dependent; retry with
+        # sendfile, but only if nothing was copied yet
+        if os.lseek(src_fd, 0, os.SEEK_CUR) != 0:
+            raise
+
+    offset = 0
+    while True:
+        n = os.sendfile(dst_fd, src_fd, offset, 1 << 24)
+        if n == 0:
+            break
+        offset += n
+
+
+def _fast_move(src, dst) -> bool:
+    """Move one plain file with in-kernel copying instead of rsync.
+
+    Tries FICLONE (metadata-only reflink on XFS/Btrfs), then
+    copy_file_range/sendfile, then unlinks the source. Returns False when
+    the file actually needs rsync's treatment (hardlinks, xattrs,
+    non-regular files) or when the kernel path fails, so the caller can
+    fall back to the rsync batch.
+    """
+    try:
+        st = os.stat(src, follow_symlinks=False)
 
-    if not os.path.exists(live_fp):
-        logging.debug(f"{live_fp} does not exist on filesystem...")
+        # rsync's -HAX handling matters for these; leave them to it
+        if not stat.S_ISREG(st.st_mode) or st.st_nlink != 1:
+            return False
+        if os.listxattr(src, follow_symlinks=False):
+            return False
+
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(
+                dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, st.st_mode & 0o7777
+            )
+            try:
+                try:
+                    fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+                except OSError:
+                    _copy_fd(src_fd, dst_fd)
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+
+        shutil.copystat(src, dst)
+        try:
+            os.chown(dst, st.st_uid, st.st_gid)
+        except OSError:
+            pass  # best effort, same as running rsync unprivileged
+
+        os.unlink(src)
         return True
 
-    rsync_fp = cache + "/." + live_fp.replace(cache, "")
-    logging.debug(f"Moving via rsync {rsync_fp} to {backing}")
+    except OSError as e:
+        logging.debug(f"fast move failed for {src}: {e}")
+        try:
+            os.unlink(dst)  # don't leave a partial copy behind
+        except OSError:
+            pass
+        return False
 
+
+def move_file(cache, backing, rel, pool, size=0, audit_mode=False) -> bool:
+    """Move one cache-relative file, preferring the in-kernel fast path."""
     if audit_mode is True:
-        logging.info(f"AUDIT: Moving via rsync {rsync_fp} to {backing}")
+        return pool.submit(rel, size)  # the pool logs the AUDIT line
+
+    if _fast_move(os.path.join(cache, rel), os.path.join(backing, rel)):
+        logging.debug(f"Moved {rel} via in-kernel copy")
         return True
 
-    process = subprocess.run(
-        [
-            "rsync",
-            "-axqHAXWESR",
-            "--preallocate",
-            "--remove-source-files",
-            rsync_fp,
-            backing,
-        ]
-    )
+    return pool.submit(rel, size)
+
+
+class RsyncPool:
+    """Parallel long-running rsyncs fed cache-relative paths over stdin.
+
+    Each worker is one rsync spawned with --files-from=- --from0, so process
+    startup is amortized over every file it moves, and WORKERS of them write
+    to the backing pool concurrently to keep its device queues busy. Each
+    submitted file goes to the worker with the fewest queued bytes (greedy
+    bin-pack). Accounting is optimistic: a submitted file is assumed moved,
+    and a non-zero exit at close() only logs a warning — the next run rescans
+    and retries anything rsync left behind.
+    """
+
+    WORKERS = 4
+    FLUSH_EVERY = 256
+
+    def __init__(self, cache, backing, audit_mode=False, workers=WORKERS):
+        self.cache = cache.rstrip("/")
+        self.backing = backing.rstrip("/")
+        self.audit_mode = audit_mode
+        self.procs = [None] * workers
+        self.queued = [0] * workers
+        self.submitted = [0] * workers
+
+    def _spawn(self):
+        return subprocess.Popen(
+            [
+                "rsync",
+                "-axqHAXWES",
+                "--preallocate",
+                "--remove-source-files",
+                "--files-from=-",
+                "--from0",
+                self.cache + "/",
+                self.backing,
+            ],
+            stdin=subprocess.PIPE,
+        )
+
+    def submit(self, rel, size=0) -> bool:
+        """Queue one cache-relative path on the least-loaded worker."""
+        if self.audit_mode is True:
+            logging.info(f"AUDIT: Moving via rsync {rel} to {self.backing}")
+            return True
+
+        w = min(range(len(self.procs)), key=self.queued.__getitem__)
+
+        if self.procs[w] is None:
+            self.procs[w] = self._spawn()
+
+        logging.debug(f"Moving via rsync {rel} to {self.backing} (worker {w})")
+
+        try:
+            self.procs[w].stdin.write(os.fsencode(rel) + b"\0")
+            self.queued[w] += size
+            self.submitted[w] += 1
+            if self.submitted[w] % self.FLUSH_EVERY == 0:
+                self.procs[w].stdin.flush()
+        except OSError:
+            # the worker died; reap it and let the next submit respawn one,
+            # otherwise its frozen queued count keeps attracting every file
+            returncode = self.procs[w].wait()
+            logging.warning(
+                f"rsync worker {w} to {self.backing} died early (code: {returncode})"
+            )
+            self.procs[w] = None
+            return False
 
-    if process.returncode == 0:
         return True
-    else:
-        logging.warning(
-            f"rsync failed: {rsync_fp} to {backing}. (code: {process.returncode})"
-        )
-        return False
+
+    def close(self) -> bool:
+        """Finish all streams and wait; True if every worker exited cleanly."""
+        ok = True
+
+        for w, proc in enumerate(self.procs):
+            if proc is None:
+                continue
+
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+
+            returncode = proc.wait()
+            if returncode != 0:
+                logging.warning(
+                    f"rsync worker {w} to {self.backing} exited with code {returncode}"
+                )
+                ok = False
+
+        self.procs = [None] * len(self.procs)
+        self.queued = [0] * len(self.procs)
+        self.submitted = [0] * len(self.procs)
+
+        return ok
 
 
 def main(
@@ -184,11 +819,14 @@ def main(
     assert isinstance(threshold, float) and threshold > 0
     assert isinstance(audit_mode, bool)
     assert cache_pool != backing_pool
+
+    # stat each pool once; the cache device id is reused for the scan pruning
+    cache_dev = os.stat(cache_pool).st_dev
     assert (
-        os.stat(cache_pool).st_dev != os.stat(backing_pool).st_dev
+        cache_dev != os.stat(backing_pool).st_dev
     ), "CACHE pool must not be same device as the BACKING pool"
 
-    total_size, used_size, free_size = shutil.disk_usage(cache_pool)
+    total_size, used_size, _ = shutil.disk_usage(cache_pool)
 
     ratio = used_size / total_size
     if ratio < threshold:
@@ -204,14 +842,14 @@ def main(
         metadata = {}
 
     logging.info("Updating metadata...")
-    update_metadata(cache_pool, metadata)
+    update_metadata(cache_pool, metadata, base_dev=cache_dev)
 
     if metadata_path is not None:
         logging.info("Saving metadata...")
         save_metadata(metadata_path, metadata)
 
-    live_size = sum(metadata["0"]["files"][p][6] for p in metadata["0"]["files"])
-    snap_size = used_size - live_size
+    live = metadata["0"]
+    live_size = int(live.st_size.sum())
 
     ratio = live_size / total_size
     if ratio < threshold:
@@ -220,20 +858,27 @@ def main(
         )
         exit(0)
 
-    not_in_snap, in_snap, stale_files = get_filelists(metadata, stale_atime_days)
+    use_mtime = _mount_is_noatime(cache_pool)
+    if use_mtime:
+        logging.info("Cache pool is mounted noatime... sorting by mtime instead")
+
+    not_in_snap, in_snap, stale_files = get_filelists(
+        metadata, stale_atime_days, use_mtime
+    )
     logging.info(f"Found {len(not_in_snap)} files not in latest snapshot")
     logging.info(f"Found {len(in_snap)} files in latest snapshot")
     logging.info(f"Found {len(stale_files)} stale files in snapshot")
 
-    live_files = not_in_snap + in_snap
+    live_files = np.concatenate((not_in_snap, in_snap))
 
-    ratio = live_size / total_size
     logging.info(f"Moving lives files... current usage ({ratio})")
 
     move_count = 0
     start_size = live_size
+    moved = []
+    pool = RsyncPool(cache_pool, backing_pool, audit_mode)
 
-    for fp, stats in live_files:
+    for i in live_files:
         ratio = live_size / total_size
 
         if ratio < threshold:
@@ -243,14 +888,19 @@ def main(
 
             break
 
-        if rsync_move(cache_pool, backing_pool, fp, audit_mode):
-            live_size -= stats[6]  # bytes
+        rel = live.paths[i]
+        size = int(live.st_size[i])
+
+        if move_file(cache_pool, backing_pool, rel, pool, size, audit_mode):
+            live_size -= size  # bytes
             move_count += 1
-            metadata["0"]["files"].pop(fp, None)
+            moved.append(i)
 
     else:
         logging.info("Completed... No files remaining...")
 
+    pool.close()
+
     logging.info(
         f"Moved {move_count} file(s) with total size of {(start_size-live_size)/1.074e+9:.3f} GiB. Usage: {ratio:.3f}"
     )
@@ -260,11 +910,21 @@ def main(
     stale_moved_count = 0
 
     logging.info(f"Moving additional stale files... current usage ({ratio})")
-    for fp, stats in stale_files:
-        if rsync_move(cache_pool, backing_pool, fp, audit_mode):
-            if metadata["0"]["files"].pop(fp, None) is not None:
-                stale_moved_size += stats[6]  # bytes
-                stale_moved_count += 1
+    moved_set = set(moved)
+    for i in stale_files:
+        if i in moved_set:
+            continue
+
+        rel = live.paths[i]
+        size = int(live.st_size[i])
+
+        if move_file(cache_pool, backing_pool, rel, pool, size, audit_mode):
+            stale_moved_size += size  # bytes
+            stale_moved_count += 1
+            moved.append(i)
+
+    pool.close()
+    live.remove(moved)
 
     ratio = (live_size - stale_moved_size) / total_size
     logging.info(
@@ -276,7 +936,7 @@ def main(
         if audit_mode is False:
             save_metadata(metadata_path, metadata)
         else:
-            save_metadata(metadata_path + "_audit.json", metadata)
+            save_metadata(metadata_path + "_audit.pickle", metadata)
 
 
 if __name__ == "__main__":